@@ -0,0 +1,25 @@
+import argparse
+import json
+import os
+
+from classes.console_driver import ConsoleDriver
+
+
+parser = argparse.ArgumentParser(description="Нагрузочный прогон консольного интерфейса по записанной сессии")
+parser.add_argument("--books", type=int, default=10000, help="количество книг в сгенерированной библиотеке")
+parser.add_argument("--operations", type=int, default=5000, help="количество действий в сгенерированной сессии")
+parser.add_argument("--session", help="путь к json-файлу с записанной сессией вместо сгенерированной")
+parser.add_argument("--memory", action="store_true", help="замерять пиковое потребление памяти")
+args = parser.parse_args()
+
+console_driver = ConsoleDriver("./bench_books.json")
+try:
+    console_driver.generate_catalog(args.books)
+    if args.session:
+        session = console_driver.load_session(args.session)
+    else:
+        session = console_driver.generate_session(args.operations, args.books)
+    report = console_driver.run_session(session, trace_memory=args.memory)
+finally:
+    os.remove("./bench_books.json")
+print(json.dumps(report, ensure_ascii=False, indent=4))
@@ -1,5 +1,10 @@
 import json
+import os
+import uuid
+
 from .book import Book
+from .book_result import BookResult
+from .snapshot_result import SnapshotResult
 
 
 class BookManager:
@@ -7,6 +12,8 @@ class BookManager:
     Класс, отвечающий за работу с книгами - чтение, запись, создание, поиск, обновление
     """
 
+    MAX_INCREMENTAL_CHAIN = 16
+
     def __init__(self, file_link: str) -> None:
         """
         Метод-конструктор класса
@@ -14,26 +21,31 @@ class BookManager:
         :param file_link: путь к файлу books.json
         """
         self.file_link = file_link
+        self.snapshots_dir = f"{os.path.splitext(self.file_link)[0]}_snapshots"
+        self._changed_ids = set()
+        self._deleted_ids = set()
+        self._tracked_snapshot = None
         with open(self.file_link, 'w', encoding="utf-8") as f:
             pass
 
-    def read_books(self) -> dict:
+    def read_books(self) -> BookResult:
         """
         Метод, отвечающий за считывание всех книг из файла
-        Если файл пустой - возвращает словарь со статус-кодом 404
-        Если возникли проблемы при чтении файлы - возвращает словарь со статус-кодом 500
-        В случае успешного чтения и наличия книг - возвращает словарь со статус-кодом 200
+        Если файл пустой - возвращает результат со статус-кодом 404
+        Если возникли проблемы при чтении файлы - возвращает результат со статус-кодом 500
+        В случае успешного чтения и наличия книг - возвращает результат со статус-кодом 200
 
-        :return: словарь со всеми книгами и статус-кодом
+        :return: результат со всеми книгами и статус-кодом
         """
         with open(self.file_link, encoding="utf-8") as f:
             try:
-                data = {"status_code": 200}
-                data.update(json.load(f))
+                books = json.load(f)
+                books.pop("status_code", None)
+                data = BookResult(200, books)
             except json.decoder.JSONDecodeError:
-                data = {"status_code": 404}
+                data = BookResult(404)
             except Exception as e:
-                data = {"status_code": 500}
+                data = BookResult(500)
         return data
 
     def _create_book_id(self) -> int:
@@ -44,29 +56,80 @@ class BookManager:
         :return: созданный уникальный идентификатор
         """
         data = self.read_books()
-        if data["status_code"] == 404 or data["status_code"] == 500:
+        if data.status_code == 404 or data.status_code == 500:
             return 1
         else:
-            return len(data.keys())
+            return len(data.books) + 1
 
-    def _write_books(self, books: dict) -> dict:
+    def _write_books(self, books: dict, changed_ids: tuple = (), deleted_ids: tuple = ()) -> BookResult:
         """
         Метод, отвечающий за запись всех книг в файл books.json
         Получает на вход словарь и, преобразовав его в json, записывает в файл
-        Если возникли проблемы при записи в файл - возвращает словарь со статус-кодом 500
-        В случае успешной записи - возвращает словарь со статус-кодом 200
+        Запись атомарная, поэтому читатели (в том числе снимки) всегда видят целостное состояние файла
+        После успешной записи запоминает идентификаторы измененных и удаленных книг
+        для следующего инкрементального снимка
+        Если возникли проблемы при записи в файл - возвращает результат со статус-кодом 500
+        В случае успешной записи - возвращает результат со статус-кодом 200
 
         :param books: словарь с книгами
-        :return: словарь со статус-кодом операции
+        :param changed_ids: идентификаторы добавленных или измененных книг
+        :param deleted_ids: идентификаторы удаленных книг
+        :return: результат со статус-кодом операции
+        """
+        try_write = self._atomic_write(self.file_link, books)
+        if try_write.status_code == 200:
+            for book_id in changed_ids:
+                self._changed_ids.add(str(book_id))
+                self._deleted_ids.discard(str(book_id))
+            for book_id in deleted_ids:
+                self._deleted_ids.add(str(book_id))
+                self._changed_ids.discard(str(book_id))
+        return try_write
+
+    @staticmethod
+    def _atomic_write(file_link: str, data: dict | None) -> BookResult:
+        """
+        Метод для атомарной записи json в файл.
+        Данные записываются во временный файл в той же директории, который затем подменяет исходный файл,
+        поэтому файл никогда не бывает частично записанным
+        Временный файл получает права исходного файла, а новый файл - права по умолчанию с учетом umask
+        Если данные не переданы - файл становится пустым, что означает отсутствие книг
+        Если возникли проблемы при записи в файл - возвращает результат со статус-кодом 500
+        В случае успешной записи - возвращает результат со статус-кодом 200
+
+        :param file_link: путь к файлу
+        :param data: данные для записи
+        :return: результат со статус-кодом операции
         """
+        tmp_link = None
         try:
-            with open(self.file_link, 'w', encoding="utf-8") as f:
-                f.write(json.dumps(books, ensure_ascii=False))
-            return {"status_code": 200}
+            tmp_link = f"{file_link}.{uuid.uuid4().hex}.tmp"
+            fd = os.open(tmp_link, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            with open(fd, 'w', encoding="utf-8") as f:
+                if data is not None:
+                    f.write(json.dumps(data, ensure_ascii=False))
+            if os.path.exists(file_link):
+                os.chmod(tmp_link, os.stat(file_link).st_mode & 0o7777)
+            os.replace(tmp_link, file_link)
+            return BookResult(200)
         except Exception as e:
-            return {"status_code": 500}
+            if tmp_link is not None and os.path.exists(tmp_link):
+                os.remove(tmp_link)
+            return BookResult(500)
 
-    def add_book(self, title: str, author: str, year: int) -> dict:
+    def load_books(self, books: dict) -> BookResult:
+        """
+        Метод для загрузки библиотеки целиком, например сгенерированной для нагрузочного прогона.
+        Заменяет все книги в файле books.json одной записью, минуя добавление по одной книге
+        После загрузки следующий инкрементальный снимок будет полным
+
+        :param books: словарь книг по ключу в виде идентификатора книги
+        :return: результат со статус-кодом операции
+        """
+        self._tracked_snapshot = None
+        return self._write_books(books)
+
+    def add_book(self, title: str, author: str, year: int) -> BookResult:
         """
         Метод, отвечающий за добавление новой книги
         Является промежуточным звеном между двумя другими методами: методом для создания новой книги и
@@ -75,10 +138,10 @@ class BookManager:
         :param title: название книги
         :param author: автор книги
         :param year: год издания книги
-        :return: словарь со статус-кодом операции
+        :return: результат со статус-кодом операции
         """
         if not title or not author or not str(year).isdigit():
-            return {"status_code": 500}
+            return BookResult(500)
         else:
             new_book = self._create_book(title=title, author=author, year=year, status="в наличии")
             try_add = self._add_book_to_json(new_book)
@@ -100,134 +163,123 @@ class BookManager:
         new_book = Book(new_book_id, title, author, year, status)
         return new_book
 
-    def _add_book_to_json(self, book: Book) -> dict:
+    def _add_book_to_json(self, book: Book) -> BookResult:
         """
         Метод, отвечающий за запись книги в файл books.json. Считывает все книги из файла в словарь,
         затем добавляет к ним новую книгу и записывает новый словарь в файл. Если файл пустой,
         создается пустой словарь и в него записывается новая книга. Затем точно так же словарь записывается в файл
 
         :param book: объекта класса Book, представляющий собой книгу для записи
-        :return: словарь со статус-кодом операции
+        :return: результат со статус-кодом операции
         """
-        books = self.read_books()
-        if books["status_code"] == 404:
-            books = {
-                book.book_id: {"title": book.title, "author": book.author, "year": book.year, "status": book.status}}
-        else:
-            books[book.book_id] = {"title": book.title, "author": book.author, "year": book.year, "status": book.status}
-        try_write = self._write_books(books)
+        books = self.read_books().books
+        books[book.book_id] = {"title": book.title, "author": book.author, "year": book.year, "status": book.status}
+        try_write = self._write_books(books, changed_ids=(book.book_id,))
         return try_write
 
-    def _search_book(self, search_filter: str, search_filter_data: str | int) -> dict:
+    def _search_book(self, search_filter: str, search_filter_data: str | int) -> BookResult:
         """
         Метод для поиска книги по переданному фильтру.
         Является общим методом поиска, который используют остальные методы поиска.
         Считывает все книги из файла, затем через цикл ищет нужную книгу по переданным фильтру и значению фильтра
-        Если книга не найдена - возвращает словарь со статус-кодом 404
-        Если возникли проблемы при чтении файла - возвращает словарь со статус-кодом 500
+        Результат хранит только идентификаторы найденных книг, сами книги не копируются
+        Если книга не найдена - возвращает результат со статус-кодом 404
+        Если возникли проблемы при чтении файла - возвращает результат со статус-кодом 500
 
         :param search_filter: название фильтра для поиска книги
         :param search_filter_data: значение фильтра
-        :return: словарь с найденной книгой и статус-кодом операции
+        :return: результат с найденными книгами и статус-кодом операции
         """
         books = self.read_books()
-        if books["status_code"] == 500:
+        if books.status_code == 500:
             return books
-        book_data = {"status_code": 404}
-        for data_tuple in list(books.items())[1:]:
-            if search_filter in data_tuple[1]:
-                if data_tuple[1][f"{search_filter}"] == search_filter_data:
-                    book_data.update({data_tuple[0]: data_tuple[1]})
-                    book_data["status_code"] = 200
+        book_ids = tuple(book_id for book_id, book in books.books.items()
+                         if book.get(search_filter) == search_filter_data)
+        return BookResult(200 if book_ids else 404, books.books, book_ids)
 
-        return book_data
-
-    def search_book_by_title(self, title: str) -> dict:
+    def search_book_by_title(self, title: str) -> BookResult:
         """
         Метод для поиска книги по заголовку.
         Использует общий метод поиска по фильтру
-        В случае успешного поиска - возвращает словарь с найденной книгой и статус-кодом 200
-        Если книга не найдена - возвращает словарь со статус-кодом 404
-        Если возникли проблемы с чтением файла - возвращает словарь со статус-кодом 500
+        В случае успешного поиска - возвращает результат с найденной книгой и статус-кодом 200
+        Если книга не найдена - возвращает результат со статус-кодом 404
+        Если возникли проблемы с чтением файла - возвращает результат со статус-кодом 500
 
         :param title: заголовок книги
-        :return: словарь с найденной книгой и статус-кодом
+        :return: результат с найденной книгой и статус-кодом
         """
         search_data = self._search_book(search_filter="title", search_filter_data=title)
         return search_data
 
-    def search_book_by_author(self, author: str) -> dict:
+    def search_book_by_author(self, author: str) -> BookResult:
         """
         Метод для поиска книги по автору.
         Использует общий метод поиска по фильтру
-        В случае успешного поиска - возвращает словарь с найденной книгой и статус-кодом 200
-        Если книга не найдена - возвращает словарь со статус-кодом 404
-        Если возникли проблемы с чтением файла - возвращает словарь со статус-кодом 500
+        В случае успешного поиска - возвращает результат с найденной книгой и статус-кодом 200
+        Если книга не найдена - возвращает результат со статус-кодом 404
+        Если возникли проблемы с чтением файла - возвращает результат со статус-кодом 500
 
         :param author: автор книги
-        :return: словарь с найденной книгой и статус-кодом
+        :return: результат с найденной книгой и статус-кодом
         """
         search_data = self._search_book(search_filter="author", search_filter_data=author)
         return search_data
 
-    def search_book_by_year(self, year: int) -> dict:
+    def search_book_by_year(self, year: int) -> BookResult:
         """
         Метод для поиска книги по году издания.
         Использует общий метод поиска по фильтру
-        В случае успешного поиска - возвращает словарь с найденной книгой и статус-кодом 200
-        Если книга не найдена - возвращает словарь со статус-кодом 404
-        Если возникли проблемы с чтением файла - возвращает словарь со статус-кодом 500
+        В случае успешного поиска - возвращает результат с найденной книгой и статус-кодом 200
+        Если книга не найдена - возвращает результат со статус-кодом 404
+        Если возникли проблемы с чтением файла - возвращает результат со статус-кодом 500
 
         :param year: год издания книги
-        :return: словарь с найденной книгой и статус-кодом
+        :return: результат с найденной книгой и статус-кодом
         """
         search_data = self._search_book(search_filter="year", search_filter_data=year)
         return search_data
 
-    def _search_book_by_id(self, book_id) -> dict:
+    def _search_book_by_id(self, book_id) -> BookResult:
         """
         Метод для поиска книги по уникальному идентификатору.
         Считывает все книги при помощи метода для чтения книг из файла и затем ищет книгу по переданному идентификатору
-        В случае успешного поиска - возвращает словарь с найденной книгой и статус-кодом 200
-        Если книга не найдена - возвращает словарь со статус-кодом 404
-        Если возникли проблемы с чтением файла - возвращает словарь со статус-кодом 500
+        В случае успешного поиска - возвращает результат с найденной книгой и статус-кодом 200
+        Если книга не найдена - возвращает результат со статус-кодом 404
+        Если возникли проблемы с чтением файла - возвращает результат со статус-кодом 500
 
         :param book_id: уникальный идентификатор книги
-        :return: словарь с найденной книгой и статус-кодом
+        :return: результат с найденной книгой и статус-кодом
         """
         books = self.read_books()
-        book_data = {"status_code": 404}
-        if books["status_code"] == 200:
-            if self.check_book_exists(book_id):
-                book_data.update(books[str(book_id)])
-                book_data["status_code"] = 200
-        else:
-            book_data["status_code"] = 500
-        return book_data
+        if books.status_code != 200:
+            return BookResult(500)
+        if str(book_id) not in books.books:
+            return BookResult(404, is_single=True)
+        return BookResult(200, books.books, (str(book_id),), is_single=True)
 
-    def delete_book(self, book_id: int) -> dict:
+    def delete_book(self, book_id: int) -> BookResult:
         """
         Метод для удаления книги по переданному уникальному идентификатору.
         Считывает все книги из файла в словарь, используя метод для чтения книг,
         удаляет книгу из словаря и затем записывает словарь в файл, используя метод для записи всех книг
-        Если книга успешно удалена - возвращает словарь со статус-кодом 200
-        Если книга не найдена - возвращает словарь со статус-кодом 404
-        Если возникли проблемы при чтении или записи в файл - возвращает словарь со статус-кодом 500
+        Если книга успешно удалена - возвращает результат со статус-кодом 200
+        Если книга не найдена - возвращает результат со статус-кодом 404
+        Если возникли проблемы при чтении или записи в файл - возвращает результат со статус-кодом 500
 
         :param book_id: уникальный идентификатор книги
-        :return: словарь со статус-кодом операции
+        :return: результат со статус-кодом операции
         """
         books = self.read_books()
-        if books["status_code"] != 200:
-            return {"status_code": books["status_code"]}
-        if str(book_id) in books:
-            del books[str(book_id)]
-            try_write = self._write_books(books)
+        if books.status_code != 200:
+            return BookResult(books.status_code)
+        if str(book_id) in books.books:
+            del books.books[str(book_id)]
+            try_write = self._write_books(books.books, deleted_ids=(book_id,))
             return try_write
         else:
-            return {"status_code": 404}
+            return BookResult(404)
 
-    def update_book(self, book_id: int, new_book: dict) -> dict:
+    def update_book(self, book_id: int, new_book: dict) -> BookResult:
         """
         Метод для обновления книги в файле books.json. Принимает на вход идентификатор и обновленную книгу.
         Считывает все книги из файла в словарь, используя метод для чтения, затем обновляет словарь
@@ -235,24 +287,17 @@ class BookManager:
 
         :param book_id: уникальный идентификатор книги для обновления
         :param new_book: словарь, представляющий собой книгу с обновленными данными
-        :return: возвращает словарь со статус-кодом операции
+        :return: возвращает результат со статус-кодом операции
         """
         books = self.read_books()
-        try_update = {"status_code": 200}
-        if books["status_code"] != 200:
-            try_update["status_code"] = books["status_code"]
-        else:
-            if self.check_book_exists(book_id=book_id):
-                books[str(book_id)] = new_book
-                try_write = self._write_books(books)
-                if try_write != 200:
-                    try_update["status_code"] = try_write["status_code"]
-            else:
-                try_update["status_code"] = 404
-
-        return try_update
+        if books.status_code != 200:
+            return BookResult(books.status_code)
+        if str(book_id) not in books.books:
+            return BookResult(404)
+        books.books[str(book_id)] = new_book
+        return self._write_books(books.books, changed_ids=(book_id,))
 
-    def change_book_status(self, book_id: int, new_status: str) -> dict:
+    def change_book_status(self, book_id: int, new_status: str) -> BookResult:
         """
         Метод, отвечающий за изменение статуса книги.
         Функция получает книгу по идентификатору в виде словаря и изменяет статус,
@@ -260,56 +305,258 @@ class BookManager:
 
         :param book_id: идентификатор книги для изменения статуса
         :param new_status: новый статус книги
-        :return: словарь со статус-кодом операции
+        :return: результат со статус-кодом операции
         """
         book = self._search_book_by_id(book_id)
-        change_try = {"status_code": 200}
-        if book["status_code"] != 200:
-            change_try["status_code"] = book["status_code"]
-        else:
-            book["status"] = new_status
-            change_try = self.update_book(book_id, book)
-        return change_try
+        if book.status_code != 200:
+            return BookResult(book.status_code)
+        book = dict(book.books[str(book_id)])
+        book["status"] = new_status
+        return self.update_book(book_id, book)
 
     @staticmethod
-    def create_books_str_view(books: dict) -> dict:
+    def create_books_str_view(books: BookResult):
         """
         Метод, отвечающий за преобразование словаря книги в строковый вид.
-        Принимает на вход словарь книг, затем преобразует каждую книгу в строковое представление.
-        Записывает новое представление в словарь по ключу в виде идентификатора книги
-        В случае успеха возвращает словарь со статус-кодом 200
-        Если файл с книгами пустой - возвращает словарь со статус-кодом 404
-        Если возникли проблемы с чтением книг из файла - возвращает словарь со статус-кодом 500
-
-        :return: словарь с представлением книг в виде строк
-        """
-        books_views = dict()
-        books_views["status_code"] = 200
-        if books["status_code"] != 200:
-            books_views["status_code"] = books["status_code"]
-        for book_id, book_data in list(books.items())[1:]:
-            books_views[
-                book_id] = (f"\tИдентификатор книги: {book_id}\n\tНазвание: {book_data["title"]}"
-                            f"\n\tАвтор: {book_data["author"]}\n\tГод издания: {book_data["year"]}"
-                            f"\n\tСтатус книги: {book_data["status"]}")
-        return books_views
-
-    def check_book_exists(self, book_id: int) -> dict:
+        Принимает на вход результат с книгами, затем лениво преобразует каждую книгу в строковое представление.
+        Статус-код проверяется по самому результату с книгами
+
+        :return: генератор представлений книг в виде строк
+        """
+        for book_id, book_data in books.items():
+            yield (f"\tИдентификатор книги: {book_id}\n\tНазвание: {book_data["title"]}"
+                   f"\n\tАвтор: {book_data["author"]}\n\tГод издания: {book_data["year"]}"
+                   f"\n\tСтатус книги: {book_data["status"]}")
+
+    def check_book_exists(self, book_id: int) -> BookResult:
         """
         Метод для проверки существования книги.
         Считывает все книги из файла в словарь и проверяет, содержится ли в нем книга с переданным идентификатором.
-        Если книга найдена - возвращает словарь со статус-кодом 200.
-        Если книга не найдена или ошибка при чтении файла - словарь со статус-кодом 404 или 500.
+        Если книга найдена - возвращает результат со статус-кодом 200.
+        Если книга не найдена или ошибка при чтении файла - результат со статус-кодом 404 или 500.
 
         :param book_id: идентификатор книги, существование которой требуется проверить
-        :return: словарь со статус-кодом
+        :return: результат со статус-кодом
         """
         books = self.read_books()
-        check_book = {"status_code": 404}
-        if books["status_code"] != 200:
-            check_book["status_code"] = books["status_code"]
-        else:
-            if str(book_id) in books:
-                check_book["status_code"] = 200
+        if books.status_code != 200:
+            return BookResult(books.status_code)
+        if str(book_id) in books.books:
+            return BookResult(200)
+        return BookResult(404)
+
+    @staticmethod
+    def _read_json(file_link: str) -> dict | list:
+        """
+        Метод для чтения json-файла индекса или снимка.
+        Ошибки чтения не перехватываются - их обрабатывает вызывающий метод
+
+        :param file_link: путь к файлу
+        :return: содержимое файла
+        """
+        with open(file_link, encoding="utf-8") as f:
+            return json.load(f)
+
+    def list_snapshots(self) -> SnapshotResult:
+        """
+        Метод для получения снимков в порядке их создания.
+        Результат содержит описания снимков по ключу в виде названия снимка.
+        Описание снимка - словарь с ключами "type", "base" и "depth" -
+        количеством инкрементальных снимков между ним и полным снимком
+        Если снимков нет - возвращает результат со статус-кодом 404
+        Если возникли проблемы при чтении индекса - возвращает результат со статус-кодом 500
+
+        :return: результат с описаниями снимков и статус-кодом
+        """
+        try:
+            index = self._read_json(os.path.join(self.snapshots_dir, "index.json"))
+        except FileNotFoundError:
+            return SnapshotResult(404)
+        except Exception as e:
+            return SnapshotResult(500)
+        if not isinstance(index, dict):
+            return SnapshotResult(500)
+        if not index:
+            return SnapshotResult(404)
+        return SnapshotResult(200, index)
+
+    @staticmethod
+    def _is_valid_snapshot_name(name: str) -> bool:
+        """
+        Метод для проверки названия снимка.
+        Название не должно быть пустым, совпадать с индексом снимков, начинаться с точки
+        или содержать разделители пути, чтобы файл снимка всегда находился в директории снимков
+
+        :param name: название снимка
+        :return: булевый тип, означающий результат проверки
+        """
+        return (isinstance(name, str) and bool(name) and name != "index" and not name.startswith(".")
+                and os.sep not in name and "/" not in name)
+
+    @staticmethod
+    def _is_valid_snapshot(snapshot) -> bool:
+        """
+        Метод для проверки структуры файла снимка.
+        Полный снимок должен содержать словарь книг, инкрементальный - еще и базовый снимок и список удаленных книг
+
+        :param snapshot: содержимое файла снимка
+        :return: булевый тип, означающий результат проверки
+        """
+        if not isinstance(snapshot, dict) or not isinstance(snapshot.get("books"), dict):
+            return False
+        if snapshot.get("type") == "full":
+            return True
+        return (snapshot.get("type") == "incremental" and isinstance(snapshot.get("base"), str)
+                and isinstance(snapshot.get("deleted"), list))
+
+    def _resolve_snapshot(self, name: str) -> BookResult:
+        """
+        Метод для восстановления полного состояния библиотеки на момент снимка.
+        Цепочка базовых снимков считывается до ближайшего полного снимка,
+        после чего поверх него по порядку применяются сохраненные изменения и удаления
+        Длина цепочки ограничена MAX_INCREMENTAL_CHAIN, поэтому восстановление читает ограниченное число файлов
+        Читаются только файлы снимков, записанных в индекс
+        Если снимок не найден - возвращает результат со статус-кодом 404
+        Если возникли проблемы при чтении файлов или файл снимка поврежден - возвращает результат со статус-кодом 500
+
+        :param name: название снимка
+        :return: результат с книгами и статус-кодом
+        """
+        snapshots = self.list_snapshots()
+        if snapshots.status_code == 500:
+            return BookResult(500)
+        if not self._is_valid_snapshot_name(name) or name not in snapshots.snapshots:
+            return BookResult(404)
+        chain = []
+        snapshot_name = name
+        while True:
+            if not self._is_valid_snapshot_name(snapshot_name) or snapshot_name not in snapshots.snapshots:
+                return BookResult(500)
+            try:
+                snapshot = self._read_json(os.path.join(self.snapshots_dir, f"{snapshot_name}.json"))
+            except Exception as e:
+                return BookResult(500)
+            if not self._is_valid_snapshot(snapshot):
+                return BookResult(500)
+            if snapshot["type"] == "full":
+                break
+            chain.append(snapshot)
+            snapshot_name = snapshot["base"]
+        books = snapshot["books"]
+        for snapshot in reversed(chain):
+            for book_id in snapshot["deleted"]:
+                books.pop(book_id, None)
+            books.update(snapshot["books"])
+        return BookResult(200, books)
+
+    def _save_snapshot(self, name: str, snapshot: dict) -> BookResult:
+        """
+        Метод для записи файла снимка и добавления его в индекс снимков.
+        Файл снимка записывается раньше индекса, поэтому в индексе не бывает ссылок на незаписанные снимки
+        Если название снимка некорректно или уже занято - возвращает результат со статус-кодом 500
+
+        :param name: название снимка
+        :param snapshot: содержимое снимка
+        :return: результат со статус-кодом операции
+        """
+        if not self._is_valid_snapshot_name(name):
+            return BookResult(500)
+        snapshots = self.list_snapshots()
+        if snapshots.status_code == 500:
+            return BookResult(500)
+        snapshots = snapshots.snapshots
+        if name in snapshots:
+            return BookResult(500)
+        try:
+            os.makedirs(self.snapshots_dir, exist_ok=True)
+        except Exception as e:
+            return BookResult(500)
+        try_write = self._atomic_write(os.path.join(self.snapshots_dir, f"{name}.json"), snapshot)
+        if try_write.status_code != 200:
+            return try_write
+        snapshots[name] = {"type": snapshot["type"], "base": snapshot.get("base"), "depth": snapshot.get("depth", 0)}
+        return self._atomic_write(os.path.join(self.snapshots_dir, "index.json"), snapshots)
 
-        return check_book
+    def create_snapshot(self, name: str) -> BookResult:
+        """
+        Метод для создания полного именованного снимка библиотеки.
+        Файл книг считывается один раз; так как запись книг атомарна, снимок всегда целостный
+        и не блокирует параллельную запись
+        Пустой файл книг считается пустой библиотекой
+        После создания снимка изменения книг отслеживаются относительно него
+        В случае успеха возвращает результат со статус-кодом 200
+        Если название некорректно, занято или возникли проблемы с файлами - возвращает результат со статус-кодом 500
+
+        :param name: название снимка
+        :return: результат со статус-кодом операции
+        """
+        self._changed_ids = set()
+        self._deleted_ids = set()
+        self._tracked_snapshot = None
+        books = self.read_books()
+        if books.status_code == 500:
+            return books
+        try_save = self._save_snapshot(name, {"type": "full", "books": books.books})
+        if try_save.status_code == 200:
+            self._tracked_snapshot = name
+        return try_save
+
+    def create_incremental_backup(self, name: str) -> BookResult:
+        """
+        Метод для создания инкрементального снимка библиотеки.
+        Сохраняет только книги, измененные или добавленные с момента последнего снимка, и идентификаторы удаленных книг.
+        Идентификаторы берутся из записей через _write_books, поэтому базовый снимок не восстанавливается
+        и библиотека не сравнивается с ним целиком
+        Создается полный снимок, если цепочка инкрементальных снимков достигла MAX_INCREMENTAL_CHAIN
+        или изменения не отслеживались относительно последнего снимка (например, после восстановления снимка
+        или при новом экземпляре BookManager)
+        Если снимков еще нет - возвращает результат со статус-кодом 404
+        Если название некорректно, занято или возникли проблемы с файлами - возвращает результат со статус-кодом 500
+
+        :param name: название снимка
+        :return: результат со статус-кодом операции
+        """
+        snapshots = self.list_snapshots()
+        if snapshots.status_code != 200:
+            return BookResult(snapshots.status_code)
+        base_name = next(reversed(snapshots.snapshots))
+        depth = snapshots.snapshots[base_name]["depth"] + 1
+        if depth > self.MAX_INCREMENTAL_CHAIN or self._tracked_snapshot != base_name:
+            return self.create_snapshot(name)
+        changed_ids, deleted_ids = self._changed_ids, self._deleted_ids
+        self._changed_ids, self._deleted_ids = set(), set()
+        books = self.read_books()
+        if books.status_code != 500:
+            books = books.books
+            changed = {book_id: books[book_id] for book_id in changed_ids if book_id in books}
+            deleted = [book_id for book_id in deleted_ids | changed_ids if book_id not in books]
+            try_save = self._save_snapshot(name, {"type": "incremental", "base": base_name, "depth": depth,
+                                                  "books": changed, "deleted": deleted})
+            if try_save.status_code == 200:
+                self._tracked_snapshot = name
+                return try_save
+        else:
+            try_save = books
+        self._changed_ids |= changed_ids
+        self._deleted_ids |= deleted_ids
+        return try_save
+
+    def restore_snapshot(self, name: str) -> BookResult:
+        """
+        Метод для восстановления библиотеки из снимка.
+        Полное состояние на момент снимка записывается в файл books.json одной атомарной записью
+        После восстановления следующий инкрементальный снимок будет полным
+        В случае успеха возвращает результат со статус-кодом 200
+        Если снимок не найден - возвращает результат со статус-кодом 404
+        Если возникли проблемы с файлами - возвращает результат со статус-кодом 500
+
+        :param name: название снимка
+        :return: результат со статус-кодом операции
+        """
+        books = self._resolve_snapshot(name)
+        if books.status_code != 200:
+            return BookResult(books.status_code)
+        self._tracked_snapshot = None
+        if not books.books:
+            return self._atomic_write(self.file_link, None)
+        return self._write_books(books.books)
@@ -0,0 +1,111 @@
+class BookResult:
+    """
+    Класс, отвечающий за представление результата операции с книгами.
+    Хранит статус-код операции и ссылку на словарь книг без копирования.
+    Если переданы идентификаторы книг, результат содержит только эти книги из словаря.
+    Множество идентификаторов для проверки принадлежности создается при первой проверке.
+    Результат поиска одной книги по идентификатору в старом формате был словарем полей книги со статус-кодом,
+    поэтому для него методы совместимости работают с полями книги
+    """
+    __slots__ = ("status_code", "books", "book_ids", "is_single", "_book_ids_set")
+    status_code: int
+    books: dict
+    book_ids: tuple | None
+    is_single: bool
+
+    def __init__(self, status_code: int, books: dict | None = None, book_ids: list | tuple | None = None,
+                 is_single: bool = False) -> None:
+        """
+        Метод-конструктор, принимает на вход статус-код, словарь книг и, при необходимости,
+        идентификаторы книг из этого словаря, попавших в результат, и признак результата поиска одной книги
+        """
+        self.status_code = status_code
+        self.books = books if books is not None else dict()
+        self.book_ids = tuple(book_ids) if book_ids is not None else None
+        self.is_single = is_single
+        self._book_ids_set = None
+
+    def _has_book_id(self, book_id) -> bool:
+        """
+        Метод для проверки, входит ли книга в результат, за O(1)
+
+        :param book_id: идентификатор книги
+        :return: булевый тип, означающий результат проверки
+        """
+        if self.book_ids is None:
+            return book_id in self.books
+        if self._book_ids_set is None:
+            self._book_ids_set = frozenset(self.book_ids)
+        return book_id in self._book_ids_set
+
+    def __iter__(self):
+        """Метод для перебора идентификаторов книг результата"""
+        if self.book_ids is None:
+            return iter(self.books)
+        return iter(self.book_ids)
+
+    def __len__(self) -> int:
+        """Метод, возвращающий количество книг в результате"""
+        if self.book_ids is None:
+            return len(self.books)
+        return len(self.book_ids)
+
+    def __bool__(self) -> bool:
+        """
+        Метод для совместимости со словарями со статус-кодом.
+        Словарь со статус-кодом никогда не был пустым, поэтому результат всегда истинен, даже без книг
+        """
+        return True
+
+    def items(self):
+        """Метод для ленивого перебора пар (идентификатор, книга) результата"""
+        return ((book_id, self.books[book_id]) for book_id in self)
+
+    def values(self):
+        """Метод для ленивого перебора книг результата"""
+        return (self.books[book_id] for book_id in self)
+
+    def __getitem__(self, key):
+        """
+        Метод для совместимости со словарями со статус-кодом.
+        По ключу "status_code" возвращает статус-код, по остальным ключам - книгу результата
+        или, для результата поиска одной книги, поле этой книги.
+        Если книги нет в результате - выбрасывает KeyError
+        """
+        if key == "status_code":
+            return self.status_code
+        if self.is_single:
+            for book in self.values():
+                return book[key]
+            raise KeyError(key)
+        if not self._has_book_id(key):
+            raise KeyError(key)
+        return self.books[key]
+
+    def __contains__(self, key) -> bool:
+        """
+        Метод для совместимости со словарями со статус-кодом.
+        Проверяет, является ли ключ статус-кодом или идентификатором книги результата
+        (для результата поиска одной книги - полем этой книги)
+        """
+        if key == "status_code":
+            return True
+        if self.is_single:
+            return any(key in book for book in self.values())
+        return self._has_book_id(key)
+
+    def as_dict(self) -> dict:
+        """
+        Метод для совместимости со старым форматом результата.
+        Создает словарь, в котором статус-код и книги хранятся вместе.
+        Для результата поиска одной книги создает словарь из статус-кода и полей книги
+
+        :return: словарь со статус-кодом и книгами
+        """
+        data = {"status_code": self.status_code}
+        if self.is_single:
+            for book in self.values():
+                data.update(book)
+            return data
+        data.update(self.items())
+        return data
@@ -10,13 +10,21 @@ class ConsoleManager:
     Реализует вывод консольного интерфейса для пользователя
     """
 
-    def __init__(self, file_link) -> None:
+    MAIN_MENU_HEADER = "---" * 10 + "\nДобро пожаловать в библиотеку книг!\n"
+    MAIN_MENU_PROMPT = "\nНомер действия: "
+
+    def __init__(self, file_link, input_func=input, output_func=print) -> None:
         """
         Метод-конструктор для класса ConsoleManager.
         Создает экземпляр класса BookManager для работы с файлом книг
+        Функции ввода и вывода можно подменить, чтобы управлять консолью без терминала
         :param file_link: путь к файлу
+        :param input_func: функция ввода, по умолчанию input
+        :param output_func: функция вывода, по умолчанию print
         """
         self.book_manager = BookManager(file_link)
+        self.input_func = input_func
+        self.output_func = output_func
 
     def main_menu(self) -> None:
         """
@@ -27,15 +35,14 @@ class ConsoleManager:
         """
         actions = {1: "Отобразить все книги", 2: "Добавить новую книгу", 3: "Поиск книги", 4: "Изменить статус книги",
                    5: "Удалить книгу", 6: "Выйти из программы"}
-        print("---" * 10)
-        print("Добро пожаловать в библиотеку книг!\n")
-        print(f"Выберите действие: ")
+        self.output_func(self.MAIN_MENU_HEADER)
+        self.output_func(f"Выберите действие: ")
         for action_number, action in actions.items():
-            print(f"\t{action_number}. {action}")
-        print("---" * 10)
-        action_id = input("\nНомер действия: ")
+            self.output_func(f"\t{action_number}. {action}")
+        self.output_func("---" * 10)
+        action_id = self.input_func(self.MAIN_MENU_PROMPT)
         if not self._is_valid_operation_id(operation_id=action_id, operations_cnt=6):
-            print("\nОшибка!\nТакого действия нет\n")
+            self.output_func("\nОшибка!\nТакого действия нет\n")
             self.main_menu()
         else:
             action_id = int(action_id)
@@ -60,17 +67,16 @@ class ConsoleManager:
         Ничего не возвращает
         """
         books = self.book_manager.read_books()
-        books = self.book_manager.create_books_str_view(books)
-        print()
-        if books["status_code"] == 404:
-            print("Ошибка:\nВ библиотеке пока нет книг")
-        elif books["status_code"] == 500:
-            print("Ошибка:\nВозникли проблемы при чтении файла")
+        self.output_func()
+        if books.status_code == 404:
+            self.output_func("Ошибка:\nВ библиотеке пока нет книг")
+        elif books.status_code == 500:
+            self.output_func("Ошибка:\nВозникли проблемы при чтении файла")
         else:
-            print("Книги, принадлежащие библиотеке:")
-            print("---" * 10)
-            for book in list(books.values())[1:]:
-                print(book + "\n")
+            self.output_func("Книги, принадлежащие библиотеке:")
+            self.output_func("---" * 10)
+            for book in self.book_manager.create_books_str_view(books):
+                self.output_func(book + "\n")
 
         self.main_menu()
 
@@ -81,29 +87,29 @@ class ConsoleManager:
         Использует метод класса BookManager для удаления книги из файла.
         Ничего не возвращает
         """
-        print("\nУдаление книги. Для отмены введите 0")
-        book_id = input("\nВведите идентификатор книги: ")
+        self.output_func("\nУдаление книги. Для отмены введите 0")
+        book_id = self.input_func("\nВведите идентификатор книги: ")
         if not self._is_valid_book_id(book_id=book_id):
-            print("Введен некорректный идентификатор книги")
+            self.output_func("Введен некорректный идентификатор книги")
             while not self._is_valid_book_id(book_id=book_id):
-                book_id = input("\nВведите идентификатор книги: ")
+                book_id = self.input_func("\nВведите идентификатор книги: ")
                 if not self._is_valid_book_id(book_id=book_id):
-                    print("Введен некорректный идентификатор книги")
+                    self.output_func("Введен некорректный идентификатор книги")
         book_id = int(book_id)
         if book_id == 0:
             self.main_menu()
         check_book = self.book_manager.check_book_exists(book_id)
-        print()
-        if check_book["status_code"] == 404:
-            print("Ошибка:\nТакой книги не существует")
-        elif check_book["status_code"] == 500:
-            print("Ошибка:\nВозникли проблемы при чтении файла")
+        self.output_func()
+        if check_book.status_code == 404:
+            self.output_func("Ошибка:\nТакой книги не существует")
+        elif check_book.status_code == 500:
+            self.output_func("Ошибка:\nВозникли проблемы при чтении файла")
         else:
             try_delete = self.book_manager.delete_book(book_id)
-            if try_delete["status_code"] != 200:
-                print("Ошибка:\nВозникли проблемы при удалении книги")
+            if try_delete.status_code != 200:
+                self.output_func("Ошибка:\nВозникли проблемы при удалении книги")
             else:
-                print("Книга успешно удалена")
+                self.output_func("Книга успешно удалена")
         self.main_menu()
 
     def _add_book(self) -> None:
@@ -113,42 +119,42 @@ class ConsoleManager:
         Использует метод класса BookManager.
         Ничего не возвращает
         """
-        print("Добавление новой книги в библиотеку. Введите 0 для отмены")
-        title = input("Укажите название книги: ")
+        self.output_func("Добавление новой книги в библиотеку. Введите 0 для отмены")
+        title = self.input_func("Укажите название книги: ")
         if len(title) == 0:
-            print("У книги должно быть название")
+            self.output_func("У книги должно быть название")
             while len(title) == 0:
-                title = input("Укажите название книги: ")
+                title = self.input_func("Укажите название книги: ")
                 if len(title) == 0:
-                    print("У книги должно быть название")
+                    self.output_func("У книги должно быть название")
         elif title == '0':
             self.main_menu()
 
-        author = input("Укажите автора книги: ")
+        author = self.input_func("Укажите автора книги: ")
         if len(author) == 0:
-            print("У книги должен быть автор")
+            self.output_func("У книги должен быть автор")
             while len(author) == 0:
-                author = input("Укажите автора книги: ")
+                author = self.input_func("Укажите автора книги: ")
                 if len(author) == 0:
-                    print("У книги должен быть автор")
+                    self.output_func("У книги должен быть автор")
         elif author == '0':
             self.main_menu()
 
-        year = int(input("Укажите год издания книги: "))
+        year = int(self.input_func("Укажите год издания книги: "))
         year_now = datetime.datetime.now().year
         if year < 0 or year > year_now:
-            print(f"Год издания должен быть в диапазоне от 0 до {year_now}")
+            self.output_func(f"Год издания должен быть в диапазоне от 0 до {year_now}")
             while year < 0 or year > year_now:
-                year = int(input("Укажите год издания книги: "))
+                year = int(self.input_func("Укажите год издания книги: "))
                 if year < 0 or year > year_now:
-                    print(f"Год издания должен быть в диапазоне от 0 до {year_now}")
+                    self.output_func(f"Год издания должен быть в диапазоне от 0 до {year_now}")
 
         try_add = self.book_manager.add_book(title, author, year)
-        print()
-        if try_add["status_code"] != 200:
-            print("Ошибка:\nВозникли проблемы с добавлением книги в файл")
+        self.output_func()
+        if try_add.status_code != 200:
+            self.output_func("Ошибка:\nВозникли проблемы с добавлением книги в файл")
         else:
-            print("Книга успешно добавлена!")
+            self.output_func("Книга успешно добавлена!")
 
         self.main_menu()
 
@@ -160,43 +166,43 @@ class ConsoleManager:
         Использует методы класса BookManager.
         Ничего не возвращает
         """
-        print("Изменение статуса книги. Введите 0 для отмены операции")
-        book_id = input("\nВведите идентификатор книги: ")
+        self.output_func("Изменение статуса книги. Введите 0 для отмены операции")
+        book_id = self.input_func("\nВведите идентификатор книги: ")
         if not self._is_valid_book_id(book_id=book_id):
-            print("Введен некорректный идентификатор книги")
+            self.output_func("Введен некорректный идентификатор книги")
             while not self._is_valid_book_id(book_id=book_id):
-                book_id = input("\nВведите идентификатор книги: ")
+                book_id = self.input_func("\nВведите идентификатор книги: ")
                 if not self._is_valid_book_id(book_id=book_id):
-                    print("Введен некорректный идентификатор книги")
+                    self.output_func("Введен некорректный идентификатор книги")
         book_id = int(book_id)
         if book_id == 0:
             self.main_menu()
         check_book = self.book_manager.check_book_exists(book_id)
-        if check_book["status_code"] == 404:
-            print("Ошибка:\nКниги с таким идентификатором не существует")
-        elif check_book["status_code"] == 500:
-            print("Ошибка:\nВозникли проблемы при чтении файла")
+        if check_book.status_code == 404:
+            self.output_func("Ошибка:\nКниги с таким идентификатором не существует")
+        elif check_book.status_code == 500:
+            self.output_func("Ошибка:\nВозникли проблемы при чтении файла")
         else:
             new_statuses = ["в наличии", "выдана"]
-            print("\nВыберите новый статус книги:\n\t1 - в наличии\n\t2 - выдана\n\t0 - отмена операции")
-            new_status_id = input("\nНовый статус: ")
-            print(new_status_id)
+            self.output_func("\nВыберите новый статус книги:\n\t1 - в наличии\n\t2 - выдана\n\t0 - отмена операции")
+            new_status_id = self.input_func("\nНовый статус: ")
+            self.output_func(new_status_id)
             if not self._is_valid_operation_id(operation_id=new_status_id, operations_cnt=2):
-                print("\nНет такого статуса")
+                self.output_func("\nНет такого статуса")
                 while not self._is_valid_operation_id(operation_id=new_status_id, operations_cnt=2):
-                    new_status_id = input("Новый статус: ")
+                    new_status_id = self.input_func("Новый статус: ")
                     if not self._is_valid_operation_id(operation_id=new_status_id, operations_cnt=2):
-                        print("\nНет такого статуса")
+                        self.output_func("\nНет такого статуса")
             new_status_id = int(new_status_id)
             if new_status_id == 0:
                 self.main_menu()
 
             try_change = self.book_manager.change_book_status(book_id=book_id,
                                                               new_status=new_statuses[new_status_id - 1])
-            if try_change["status_code"] != 200:
-                print("\nОшибка:\nВозникли проблемы с изменением статуса книги")
+            if try_change.status_code != 200:
+                self.output_func("\nОшибка:\nВозникли проблемы с изменением статуса книги")
             else:
-                print("\nСтатус книги успешно изменен")
+                self.output_func("\nСтатус книги успешно изменен")
         self.main_menu()
 
     @staticmethod
@@ -228,82 +234,79 @@ class ConsoleManager:
         и строкового представления книги.
         Ничего не возвращает.
         """
-        print("\nПоиск книги. Введите 0 для отмены")
-        print("Выберите тип поиска:\n\t1 - по названию\n\t2 - по автору\n\t3 - по году издания")
-        search_type = input("Тип поиска: ")
+        self.output_func("\nПоиск книги. Введите 0 для отмены")
+        self.output_func("Выберите тип поиска:\n\t1 - по названию\n\t2 - по автору\n\t3 - по году издания")
+        search_type = self.input_func("Тип поиска: ")
         if not self._is_valid_operation_id(operation_id=search_type, operations_cnt=3):
-            print("Нет такого типа поиска")
+            self.output_func("Нет такого типа поиска")
             while not self._is_valid_operation_id(operation_id=search_type, operations_cnt=3):
-                search_type = input("Тип поиска: ")
+                search_type = self.input_func("Тип поиска: ")
                 if not self._is_valid_operation_id(operation_id=search_type, operations_cnt=3):
-                    print("Нет такого типа поиска")
+                    self.output_func("Нет такого типа поиска")
         search_type = int(search_type)
         if search_type == 0:
             self.main_menu()
 
         if search_type == 1:
-            title = input("Введите заголовок книги: ")
+            title = self.input_func("Введите заголовок книги: ")
             if len(title) == 0:
-                print("У книги должно быть название")
+                self.output_func("У книги должно быть название")
                 while len(title) == 0:
-                    title = input("Укажите название книги: ")
+                    title = self.input_func("Укажите название книги: ")
                     if len(title) == 0:
-                        print("У книги должно быть название")
+                        self.output_func("У книги должно быть название")
             try_search = self.book_manager.search_book_by_title(title=title)
-            print()
-            print("Результат поиска:")
-            print()
-            if try_search["status_code"] == 404:
-                print("Ошибка:\nКнига с таким заголовком не найдена")
-            elif try_search["status_code"] == 500:
-                print("Ошибка:\nВозникли проблемы при чтении файла")
+            self.output_func()
+            self.output_func("Результат поиска:")
+            self.output_func()
+            if try_search.status_code == 404:
+                self.output_func("Ошибка:\nКнига с таким заголовком не найдена")
+            elif try_search.status_code == 500:
+                self.output_func("Ошибка:\nВозникли проблемы при чтении файла")
             else:
-                books = self.book_manager.create_books_str_view(try_search)
-                for book in list(books.values())[1:]:
-                    print(book + "\n")
+                for book in self.book_manager.create_books_str_view(try_search):
+                    self.output_func(book + "\n")
 
         elif search_type == 2:
-            author = input("Введите автора книги: ")
+            author = self.input_func("Введите автора книги: ")
             if len(author) == 0:
-                print("У книги должен быть автор")
+                self.output_func("У книги должен быть автор")
                 while len(author) == 0:
-                    author = input("Укажите автора книги: ")
+                    author = self.input_func("Укажите автора книги: ")
                     if len(author) == 0:
-                        print("У книги должен быть автор")
+                        self.output_func("У книги должен быть автор")
             try_search = self.book_manager.search_book_by_author(author=author)
-            print()
-            print("Результат поиска:")
-            print()
-            if try_search["status_code"] == 404:
-                print("Ошибка:\nКнига с таким автором не найдена")
-            elif try_search["status_code"] == 500:
-                print("Ошибка:\nВозникли проблемы при чтении файла")
+            self.output_func()
+            self.output_func("Результат поиска:")
+            self.output_func()
+            if try_search.status_code == 404:
+                self.output_func("Ошибка:\nКнига с таким автором не найдена")
+            elif try_search.status_code == 500:
+                self.output_func("Ошибка:\nВозникли проблемы при чтении файла")
             else:
-                books = self.book_manager.create_books_str_view(try_search)
-                for book in list(books.values())[1:]:
-                    print(book + "\n")
+                for book in self.book_manager.create_books_str_view(try_search):
+                    self.output_func(book + "\n")
 
         elif search_type == 3:
-            year = input("Введите год издания книги: ")
+            year = self.input_func("Введите год издания книги: ")
             if len(year) == 0:
-                print("У книги должен быть год издания")
+                self.output_func("У книги должен быть год издания")
                 while len(year) == 0:
-                    year = input("Укажите год издания книги: ")
+                    year = self.input_func("Укажите год издания книги: ")
                     if len(year) == 0:
-                        print("У книги должен быть год издания")
+                        self.output_func("У книги должен быть год издания")
             year = int(year)
             try_search = self.book_manager.search_book_by_year(year=year)
-            print()
-            print("Результат поиска:")
-            print()
-            if try_search["status_code"] == 404:
-                print("Ошибка:\nКнига с таким годом издания не найдена")
-            elif try_search["status_code"] == 500:
-                print("Ошибка:\nВозникли проблемы при чтении файла")
+            self.output_func()
+            self.output_func("Результат поиска:")
+            self.output_func()
+            if try_search.status_code == 404:
+                self.output_func("Ошибка:\nКнига с таким годом издания не найдена")
+            elif try_search.status_code == 500:
+                self.output_func("Ошибка:\nВозникли проблемы при чтении файла")
             else:
-                books = self.book_manager.create_books_str_view(try_search)
-                for book in list(books.values())[1:]:
-                    print(book + "\n")
+                for book in self.book_manager.create_books_str_view(try_search):
+                    self.output_func(book + "\n")
 
         self.main_menu()
 
@@ -0,0 +1,223 @@
+import json
+import random
+import statistics
+import time
+import tracemalloc
+from collections import deque
+
+from .book_result import BookResult
+from .conslole_manager import ConsoleManager
+
+
+class _ActionFinished(Exception):
+    """Исключение, которым драйвер прерывает рекурсию главного меню после завершения действия"""
+
+
+class SessionExhausted(Exception):
+    """Исключение, которое выбрасывается, если консоль запросила ввод, которого нет в сессии"""
+
+
+class ConsoleDriver:
+    """
+    Класс для управления консолью без терминала.
+    Подает экземпляру ConsoleManager записанную сессию вводов и замеряет время каждого действия
+    от ввода номера действия до вывода результата, то есть до начала вывода главного меню
+    """
+
+    def __init__(self, file_link: str) -> None:
+        """
+        Метод-конструктор класса.
+        Создает экземпляр класса ConsoleManager с подмененными функциями ввода и вывода
+
+        :param file_link: путь к файлу с книгами
+        """
+        self.console_manager = ConsoleManager(file_link, input_func=self._input, output_func=self._output)
+        self.last_output = []
+        self._inputs = deque()
+        self._started_at = None
+        self._finished_at = None
+        self._output_chars = 0
+
+    def _input(self, prompt: str = "") -> str:
+        """
+        Подменная функция ввода.
+        Возвращает следующий ввод текущего действия.
+        Если консоль запросила ввод, которого нет в сессии - выбрасывает SessionExhausted
+
+        :param prompt: приглашение к вводу
+        :return: введенная строка
+        """
+        self._output(prompt, end="")
+        if self._started_at is None:
+            self._started_at = time.perf_counter()
+        if not self._inputs:
+            raise SessionExhausted(f"В сессии не хватает ввода для запроса {prompt.strip()!r}")
+        return self._inputs.popleft()
+
+    def _output(self, *args, sep: str = " ", end: str = "\n") -> None:
+        """
+        Подменная функция вывода.
+        Сохраняет вывод текущего действия вместо печати в консоль.
+        Если консоль начала выводить главное меню - останавливает замер и прерывает действие,
+        чтобы вывод меню не попадал в задержку и стек вызовов не рос от действия к действию
+        """
+        text = sep.join(str(arg) for arg in args) + end
+        if self._started_at is not None and text.startswith(ConsoleManager.MAIN_MENU_HEADER):
+            self._finished_at = time.perf_counter()
+            raise _ActionFinished
+        self._output_chars += len(text)
+        self.last_output.append(text)
+
+    def run_action(self, inputs: list) -> dict:
+        """
+        Метод для выполнения одного действия консоли.
+        Первый ввод - номер действия главного меню, остальные - вводы внутри действия.
+        Вводы, которые не понадобились консоли (например, после ошибки), отбрасываются
+
+        :param inputs: список вводов действия
+        :return: словарь с временем выполнения по ключу "time", числом отброшенных вводов и признаком выхода
+        """
+        self.last_output = []
+        self._inputs = deque(str(item) for item in inputs)
+        self._started_at = None
+        self._finished_at = None
+        is_exit = False
+        try:
+            self.console_manager.main_menu()
+        except _ActionFinished:
+            pass
+        except SystemExit:
+            self._finished_at = time.perf_counter()
+            is_exit = True
+        return {"time": self._finished_at - self._started_at, "skipped_inputs": len(self._inputs), "exit": is_exit}
+
+    def run_session(self, session: list, trace_memory: bool = False) -> dict:
+        """
+        Метод для воспроизведения сессии - списка действий, каждое из которых является списком вводов.
+        Воспроизведение останавливается на действии выхода из программы
+
+        :param session: список действий
+        :param trace_memory: замерять ли пиковое потребление памяти через tracemalloc
+        :return: словарь с отчетом о задержках по каждому типу действия и типу поиска
+        """
+        latencies = dict()
+        skipped_inputs = 0
+        self._output_chars = 0
+        if trace_memory:
+            tracemalloc.start()
+        started_at = time.perf_counter()
+        try:
+            for inputs in session:
+                result = self.run_action(inputs)
+                latencies.setdefault(self._action_key(inputs), []).append(result["time"])
+                skipped_inputs += result["skipped_inputs"]
+                if result["exit"]:
+                    break
+        finally:
+            total_time = time.perf_counter() - started_at
+            peak_memory = tracemalloc.get_traced_memory()[1] if trace_memory else None
+            if trace_memory:
+                tracemalloc.stop()
+
+        return {
+            "actions_cnt": sum(len(times) for times in latencies.values()),
+            "total_time": total_time,
+            "output_chars": self._output_chars,
+            "skipped_inputs": skipped_inputs,
+            "peak_memory": peak_memory,
+            "latencies": {action_id: self._summarize(times) for action_id, times in sorted(latencies.items())},
+        }
+
+    @staticmethod
+    def _action_key(inputs: list) -> str:
+        """
+        Метод для получения ключа действия в отчете.
+        Для поиска ключ состоит из номера действия и типа поиска ("3.1", "3.2", "3.3"),
+        для остальных действий - из номера действия
+
+        :param inputs: список вводов действия
+        :return: ключ действия
+        """
+        if str(inputs[0]) == "3" and len(inputs) > 1:
+            return f"3.{inputs[1]}"
+        return str(inputs[0])
+
+    @staticmethod
+    def _summarize(times: list) -> dict:
+        """
+        Метод для подсчета статистики задержек одного типа действия
+
+        :param times: список задержек в секундах
+        :return: словарь с количеством, средним, медианой, 95-м перцентилем и максимумом
+        """
+        ordered = sorted(times)
+        return {
+            "count": len(ordered),
+            "mean": statistics.fmean(ordered),
+            "p50": ordered[(len(ordered) - 1) // 2],
+            "p95": ordered[int((len(ordered) - 1) * 0.95)],
+            "max": ordered[-1],
+        }
+
+    @staticmethod
+    def load_session(file_link: str) -> list:
+        """
+        Метод для загрузки записанной сессии из json-файла.
+        Файл должен содержать список действий, каждое из которых является списком вводов
+
+        :param file_link: путь к файлу сессии
+        :return: список действий
+        """
+        with open(file_link, encoding="utf-8") as f:
+            return json.load(f)
+
+    def generate_catalog(self, books_cnt: int, seed: int = 0) -> BookResult:
+        """
+        Метод для генерации большой библиотеки.
+        Книги загружаются в файл одной записью через BookManager.load_books
+
+        :param books_cnt: количество книг
+        :param seed: зерно генератора случайных чисел
+        :return: результат со статус-кодом операции
+        """
+        rnd = random.Random(seed)
+        books = dict()
+        for book_id in range(1, books_cnt + 1):
+            books[book_id] = {"title": f"Название {book_id}", "author": f"Автор {rnd.randint(1, books_cnt // 10 + 1)}",
+                              "year": rnd.randint(1800, 2000), "status": rnd.choice(["в наличии", "выдана"])}
+        return self.console_manager.book_manager.load_books(books)
+
+    @staticmethod
+    def generate_session(operations_cnt: int, books_cnt: int, seed: int = 0) -> list:
+        """
+        Метод для генерации сессии из смеси действий: поиск, добавление, изменение статуса, удаление
+        и, реже, вывод всех книг. Идентификаторы, названия и авторы соответствуют
+        библиотеке, созданной методом generate_catalog с тем же количеством книг
+
+        :param operations_cnt: количество действий
+        :param books_cnt: количество книг в библиотеке
+        :param seed: зерно генератора случайных чисел
+        :return: список действий
+        """
+        rnd = random.Random(seed)
+        session = []
+        for _ in range(operations_cnt):
+            book_id = rnd.randint(1, books_cnt)
+            action = rnd.choices(["show", "add", "title", "author", "year", "status", "delete"],
+                                 weights=[1, 10, 20, 20, 20, 20, 9])[0]
+            match action:
+                case "show":
+                    session.append(["1"])
+                case "add":
+                    session.append(["2", f"Новая книга {book_id}", f"Автор {book_id}", str(rnd.randint(1800, 2000))])
+                case "title":
+                    session.append(["3", "1", f"Название {book_id}"])
+                case "author":
+                    session.append(["3", "2", f"Автор {rnd.randint(1, books_cnt // 10 + 1)}"])
+                case "year":
+                    session.append(["3", "3", str(rnd.randint(1800, 2000))])
+                case "status":
+                    session.append(["4", str(book_id), str(rnd.randint(1, 2))])
+                case "delete":
+                    session.append(["5", str(book_id)])
+        return session
@@ -0,0 +1,13 @@
+class SnapshotResult:
+    """
+    Класс, отвечающий за представление результата чтения индекса снимков.
+    Хранит статус-код операции и описания снимков по ключу в виде названия снимка в порядке их создания
+    """
+    __slots__ = ("status_code", "snapshots")
+    status_code: int
+    snapshots: dict
+
+    def __init__(self, status_code: int, snapshots: dict | None = None) -> None:
+        """Метод-конструктор, принимает на вход статус-код и словарь описаний снимков"""
+        self.status_code = status_code
+        self.snapshots = snapshots if snapshots is not None else dict()
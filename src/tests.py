@@ -1,11 +1,18 @@
+import os
+import shutil
 import unittest
 from src.classes.book_manager import BookManager
+from src.classes.conslole_manager import ConsoleManager
+from src.classes.console_driver import ConsoleDriver, SessionExhausted
 
 
 class Test(unittest.TestCase):
     def setUp(self):
         self.book_manager = BookManager("./books.json")
 
+    def tearDown(self):
+        shutil.rmtree(self.book_manager.snapshots_dir, ignore_errors=True)
+
     # тесты на успешное добавление книги
     def test_add_book(self):
         self.assertEqual(self.book_manager.add_book("Название", "Автор", 1900)["status_code"], 200)
@@ -39,7 +46,167 @@ class Test(unittest.TestCase):
     def test_list_books(self):
         self.book_manager.add_book("Название", "Автор", 1900)
         result = self.book_manager.read_books()
-        self.assertEqual(len(result), 2)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(len(result.as_dict()), 2)
+
+    # тесты на создание и восстановление полного снимка
+    def test_snapshot_restore(self):
+        self.book_manager.add_book("Название", "Автор", 1900)
+        self.assertEqual(self.book_manager.create_snapshot("first")["status_code"], 200)
+        self.book_manager.delete_book(1)
+        self.assertEqual(self.book_manager.read_books()["status_code"], 200)
+        self.assertEqual(self.book_manager.restore_snapshot("first")["status_code"], 200)
+        self.assertEqual(self.book_manager.search_book_by_title("Название")["status_code"], 200)
+
+    # тесты на инкрементальный снимок - хранятся только изменения с момента последнего снимка
+    def test_incremental_backup(self):
+        self.book_manager.add_book("Название", "Автор", 1900)
+        self.book_manager.add_book("Другое название", "Автор", 1950)
+        self.book_manager.create_snapshot("first")
+        self.book_manager.delete_book(1)
+        self.book_manager.change_book_status(2, "выдана")
+        self.assertEqual(self.book_manager.create_incremental_backup("second")["status_code"], 200)
+        snapshot = self.book_manager._read_json(f"{self.book_manager.snapshots_dir}/second.json")
+        self.assertEqual(list(snapshot["books"]), ["2"])
+        self.assertEqual(snapshot["deleted"], ["1"])
+        self.book_manager.restore_snapshot("first")
+        self.book_manager.restore_snapshot("second")
+        self.assertEqual(self.book_manager.check_book_exists(1)["status_code"], 404)
+        self.assertEqual(self.book_manager._search_book_by_id(2)["status"], "выдана")
+
+    # тесты на сохранение прав файла книг при атомарной записи
+    def test_write_keeps_file_mode(self):
+        os.chmod(self.book_manager.file_link, 0o644)
+        self.book_manager.add_book("Название", "Автор", 1900)
+        self.assertEqual(os.stat(self.book_manager.file_link).st_mode & 0o777, 0o644)
+        self.book_manager.create_snapshot("first")
+        umask = os.umask(0)
+        os.umask(umask)
+        self.assertEqual(os.stat(f"{self.book_manager.snapshots_dir}/first.json").st_mode & 0o777, 0o666 & ~umask)
+
+    # тесты на длинную цепочку инкрементальных снимков - после MAX_INCREMENTAL_CHAIN создается полный снимок
+    def test_long_incremental_chain(self):
+        self.book_manager.add_book("Название", "Автор", 1900)
+        self.book_manager.create_snapshot("s0")
+        for i in range(1, 3 * BookManager.MAX_INCREMENTAL_CHAIN):
+            self.book_manager.change_book_status(1, f"статус {i}")
+            self.assertEqual(self.book_manager.create_incremental_backup(f"s{i}")["status_code"], 200)
+        snapshots = self.book_manager.list_snapshots().snapshots
+        self.assertEqual(len(snapshots), 3 * BookManager.MAX_INCREMENTAL_CHAIN)
+        self.assertLessEqual(max(item["depth"] for item in snapshots.values()), BookManager.MAX_INCREMENTAL_CHAIN)
+        self.assertEqual(len([item for item in snapshots.values() if item["type"] == "full"]), 3)
+        self.assertEqual(self.book_manager.restore_snapshot("s20")["status_code"], 200)
+        self.assertEqual(self.book_manager._search_book_by_id(1)["status"], "статус 20")
+
+    # тесты на инкрементальный снимок без отслеживаемых изменений - создается полный снимок
+    def test_incremental_backup_without_tracking(self):
+        self.book_manager.add_book("Название", "Автор", 1900)
+        self.book_manager.create_snapshot("first")
+        self.book_manager.restore_snapshot("first")
+        self.book_manager.create_incremental_backup("second")
+        book_manager = BookManager(self.book_manager.file_link)
+        book_manager.create_incremental_backup("third")
+        snapshots = book_manager.list_snapshots().snapshots
+        self.assertEqual(snapshots["second"]["type"], "full")
+        self.assertEqual(snapshots["third"]["type"], "full")
+        self.assertEqual(book_manager.restore_snapshot("third")["status_code"], 200)
+        self.assertEqual(book_manager.read_books()["status_code"], 404)
+
+    # тесты на некорректные снимки
+    def test_snapshot_invalid(self):
+        self.assertEqual(self.book_manager.create_incremental_backup("inc")["status_code"], 404)
+        self.assertEqual(self.book_manager.restore_snapshot("missing")["status_code"], 404)
+        self.assertEqual(self.book_manager.create_snapshot("")["status_code"], 500)
+        self.assertEqual(self.book_manager.create_snapshot("../first")["status_code"], 500)
+        self.book_manager.create_snapshot("first")
+        self.assertEqual(self.book_manager.create_snapshot("first")["status_code"], 500)
+
+    # тесты на восстановление по названию, которого нет в индексе снимков
+    def test_restore_snapshot_invalid_name(self):
+        self.book_manager.create_snapshot("first")
+        self.assertEqual(self.book_manager.restore_snapshot("index")["status_code"], 404)
+        self.assertEqual(self.book_manager.restore_snapshot("../books")["status_code"], 404)
+
+    # тесты на поврежденный файл снимка
+    def test_corrupted_snapshot(self):
+        self.book_manager.add_book("Название", "Автор", 1900)
+        self.book_manager.create_snapshot("first")
+        with open(f"{self.book_manager.snapshots_dir}/first.json", "w", encoding="utf-8") as f:
+            f.write("[1, 2]")
+        self.assertEqual(self.book_manager.restore_snapshot("first")["status_code"], 500)
+        self.assertEqual(self.book_manager.create_incremental_backup("second")["status_code"], 200)
+        self.assertEqual(self.book_manager.restore_snapshot("second")["status_code"], 500)
+        with open(f"{self.book_manager.snapshots_dir}/first.json", "w", encoding="utf-8") as f:
+            f.write('{"type": "incremental", "books": {}}')
+        self.assertEqual(self.book_manager.restore_snapshot("first")["status_code"], 500)
+
+    # тесты на результат поиска - хранит только идентификаторы найденных книг и совместим со старым форматом
+    def test_search_result(self):
+        self.book_manager.add_book("Название", "Автор", 1900)
+        self.book_manager.add_book("Другое название", "Автор", 1950)
+        result = self.book_manager.search_book_by_year(1950)
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(list(result), ["2"])
+        self.assertEqual(result.as_dict(), {"status_code": 200, "2": {"title": "Другое название", "author": "Автор",
+                                                                      "year": 1950, "status": "в наличии"}})
+        self.assertEqual(len(self.book_manager.search_book_by_author("Автор")), 2)
+        self.assertIn("status_code", result)
+        self.assertTrue(self.book_manager.add_book("Название", "Автор", 1900))
+        self.assertTrue(self.book_manager.search_book_by_year(90))
+        self.assertIn("2", result)
+        self.assertNotIn("1", result)
+        with self.assertRaises(KeyError):
+            result["1"]
+
+    # тесты на старый формат результата поиска книги по идентификатору
+    def test_search_by_id_result(self):
+        self.book_manager.add_book("Название", "Автор", 1900)
+        result = self.book_manager._search_book_by_id(1)
+        self.assertEqual(result.as_dict(), {"status_code": 200, "title": "Название", "author": "Автор",
+                                            "year": 1900, "status": "в наличии"})
+        self.assertIn("title", result)
+        self.assertEqual(self.book_manager._search_book_by_id(5).as_dict(), {"status_code": 404})
+
+
+class TestConsoleDriver(unittest.TestCase):
+    def setUp(self):
+        self.console_driver = ConsoleDriver("./books.json")
+
+    # тесты на выполнение действий консоли по записанной сессии
+    def test_run_session(self):
+        self.console_driver.generate_catalog(20)
+        session = [["3", "1", "Название 5"], ["2", "Название", "Автор", "1900"], ["5", "1"], ["4", "100", "1"]]
+        report = self.console_driver.run_session(session)
+        self.assertEqual(report["actions_cnt"], 4)
+        self.assertEqual(report["latencies"]["3.1"]["count"], 1)
+        self.assertEqual("".join(self.console_driver.last_output).count(ConsoleManager.MAIN_MENU_HEADER), 1)
+        self.assertEqual(report["skipped_inputs"], 1)
+        self.assertIn("Ошибка:\nКниги с таким идентификатором не существует\n", self.console_driver.last_output)
+        self.assertEqual(self.console_driver.console_manager.book_manager.check_book_exists(1)["status_code"], 404)
+
+    # тесты на остановку сессии на выходе из программы
+    def test_run_session_exit(self):
+        report = self.console_driver.run_session([["1"], ["6"], ["1"]])
+        self.assertEqual(report["actions_cnt"], 2)
+
+    # тесты на сессию, в которой не хватает ввода
+    def test_run_session_missing_input(self):
+        with self.assertRaises(SessionExhausted):
+            self.console_driver.run_session([["3", "1"]])
+
+    # тесты на ошибку консоли при некорректном вводе - не путается с нехваткой ввода
+    def test_run_session_console_error(self):
+        with self.assertRaises(ValueError) as error:
+            self.console_driver.run_session([["2", "Название", "Автор", "abc"]])
+        self.assertNotIsInstance(error.exception, SessionExhausted)
+
+    # тесты на длинную сгенерированную сессию - стек вызовов не должен расти от действия к действию
+    def test_generated_session(self):
+        self.console_driver.generate_catalog(50)
+        session = self.console_driver.generate_session(1500, 50)
+        report = self.console_driver.run_session(session, trace_memory=True)
+        self.assertEqual(report["actions_cnt"], 1500)
+        self.assertGreater(report["peak_memory"], 0)
 
 
 if __name__ == "__main__":